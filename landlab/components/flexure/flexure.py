@@ -58,11 +58,28 @@ array([[ 0.,  0.,  0.,  0.],
 """
 
 import numpy as np
+from scipy import fft
+from scipy.special import kei
 
 from landlab import Component
 
 from .funcs import get_flexure_parameter
 
+try:
+    from .cfuncs import subside_grid_in_parallel
+except ImportError:
+    subside_grid_in_parallel = None
+
+_N_NODES_TO_USE_FFT = 4096
+_N_NODES_TO_USE_OVERLAP_ADD = 2**22
+
+# The sparse scatter path costs one full-grid pass per loaded node, so it
+# only wins while the loaded nodes are few both in absolute terms (the FFT
+# path costs a fixed few dozen grid passes regardless of loading) and as a
+# fraction of the grid.
+_MAX_LOADED_NODES_FOR_SPARSE = 64
+_FRACTION_OF_NODES_LOADED_FOR_SPARSE = 0.05
+
 
 class Flexure(Component):
 
@@ -182,6 +199,7 @@ class Flexure(Component):
         rho_mantle=3300.0,
         gravity=9.80665,
         n_procs=1,
+        kernel_dtype=np.float64,
     ):
         """Initialize the flexure component.
 
@@ -201,6 +219,11 @@ class Flexure(Component):
             Acceleration due to gravity (m / s^2).
         n_procs : int, optional
             Number of processors to use for calculations.
+        kernel_dtype : dtype, optional
+            Floating-point dtype used to store the precomputed kei
+            kernel. ``numpy.float32`` halves the kernel's memory traffic
+            on the FFT and sparse paths while still accumulating
+            deflections in double precision.
         """
         if method not in ("airy", "flexure"):
             raise ValueError(f"{method}: method not understood")
@@ -211,15 +234,15 @@ class Flexure(Component):
         self._method = method
         self._rho_mantle = rho_mantle
         self._gravity = gravity
-        self.eet = eet
+        self._gamma_mantle = rho_mantle * gravity
+        self._inv_gamma_mantle = 1.0 / self._gamma_mantle
         self._n_procs = n_procs
+        self._kernel_dtype = np.dtype(kernel_dtype)
+        self._scaled_load = np.empty(grid.shape, dtype=float)
+        self.eet = eet
 
         self.initialize_output_fields()
 
-        self._r = self._create_kei_func_grid(
-            self._grid.shape, (self._grid.dy, self._grid.dx), self.alpha
-        )
-
     @property
     def eet(self):
         """Effective elastic thickness (m)."""
@@ -229,10 +252,19 @@ class Flexure(Component):
     def eet(self, new_val):
         if new_val <= 0:
             raise ValueError("Effective elastic thickness must be positive.")
+        if getattr(self, "_eet", None) == new_val:
+            return
         self._eet = new_val
-        self._r = self._create_kei_func_grid(
-            self._grid.shape, (self._grid.dy, self._grid.dx), self.alpha
+        self._alpha = get_flexure_parameter(
+            new_val, self._youngs, 2, gamma_mantle=self._gamma_mantle
         )
+        self._r = self._create_kei_func_grid(
+            self._grid.shape, (self._grid.dy, self._grid.dx), self._alpha
+        ).astype(self._kernel_dtype, copy=False)
+        self._kernel_fft = None
+        self._kernel_centered = None
+        self._kernel_double = None
+        self._padded_load = None
 
     @property
     def youngs(self):
@@ -247,7 +279,7 @@ class Flexure(Component):
     @property
     def gamma_mantle(self):
         """Specific density of mantle (N/m^3)."""
-        return self._rho_mantle * self._gravity
+        return self._gamma_mantle
 
     @property
     def gravity(self):
@@ -262,33 +294,64 @@ class Flexure(Component):
     @property
     def alpha(self):
         """Flexure parameter (m)."""
-        return get_flexure_parameter(
-            self._eet, self._youngs, 2, gamma_mantle=self.gamma_mantle
-        )
+        return self._alpha
 
     @staticmethod
     def _create_kei_func_grid(shape, xy_spacing, alpha):
-        from scipy.special import kei
+        """Create the first quadrant of the kei-based deflection kernel.
 
-        dx, dy = np.meshgrid(
-            np.arange(shape[1]) * xy_spacing[1], np.arange(shape[0]) * xy_spacing[0]
-        )
+        Since kei is a function of radius only, the kernel is symmetric
+        about the origin and only the quadrant of non-negative offsets is
+        stored. Consumers index it by absolute row and column offset, or
+        mirror it into the full kernel with :meth:`_mirror_kernel_quadrant`.
+        """
+        y = np.arange(shape[0]).reshape((-1, 1)) * xy_spacing[0]
+        x = np.arange(shape[1]).reshape((1, -1)) * xy_spacing[1]
+
+        r = np.hypot(x, y)
+        r /= alpha
+
+        # kei is expensive and many nodes share a radius, so evaluate it
+        # only on the unique radii and scatter the values back.
+        uniq, inverse = np.unique(r, return_inverse=True)
+
+        return kei(uniq)[inverse].reshape(r.shape)
+
+    @staticmethod
+    def _mirror_kernel_quadrant(quadrant, centered=False):
+        """Reflect a first-quadrant kernel into the full symmetric kernel.
+
+        If *centered* is ``False``, the returned array is twice the
+        quadrant's size along each axis and laid out for circular
+        convolution (negative offsets wrap around the far edges).
+        Otherwise it is one less than twice the quadrant's size with the
+        zero offset in the middle, as expected by a linear ``same``-mode
+        convolution.
+        """
+        n_rows, n_cols = quadrant.shape
+
+        if centered:
+            kernel = np.empty((2 * n_rows - 1, 2 * n_cols - 1), dtype=quadrant.dtype)
+            kernel[n_rows - 1 :, n_cols - 1 :] = quadrant
+            kernel[n_rows - 1 :, : n_cols - 1] = quadrant[:, -1:0:-1]
+            kernel[: n_rows - 1, :] = kernel[-1 : n_rows - 1 : -1, :]
+        else:
+            kernel = np.zeros((2 * n_rows, 2 * n_cols), dtype=quadrant.dtype)
+            kernel[:n_rows, :n_cols] = quadrant
+            kernel[:n_rows, n_cols + 1 :] = quadrant[:, -1:0:-1]
+            kernel[n_rows + 1 :, :] = kernel[n_rows - 1 : 0 : -1, :]
 
-        return kei(np.sqrt(dx**2 + dy**2) / alpha)
+        return kernel
 
     def update(self):
         """Update fields with current loading conditions."""
         load = self._grid.at_node["lithosphere__overlying_pressure_increment"]
         deflection = self._grid.at_node["lithosphere_surface__elevation_increment"]
 
-        new_load = load.copy()
-
-        deflection.fill(0.0)
-
         if self.method == "airy":
-            deflection[:] = new_load / self.gamma_mantle
+            np.multiply(load, self._inv_gamma_mantle, out=deflection)
         else:
-            self.subside_loads(new_load, out=deflection)
+            self.subside_loads(load, out=deflection)
 
     def subside_loads(self, loads, out=None):
         """Subside surface due to multiple loads.
@@ -298,7 +361,8 @@ class Flexure(Component):
         loads : ndarray of float
             Loads applied to each grid node.
         out : ndarray of float, optional
-            Buffer to place resulting deflection values.
+            Buffer to place resulting deflection values. Any existing
+            contents are overwritten.
 
         Returns
         -------
@@ -306,19 +370,118 @@ class Flexure(Component):
             Deflections caused by the loading.
         """
         if out is None:
-            out = np.zeros(self._grid.shape, dtype=float)
+            out = np.empty(self._grid.shape, dtype=float)
         dz = out.reshape(self._grid.shape)
         load = loads.reshape(self._grid.shape)
 
-        from .cfuncs import subside_grid_in_parallel
+        sources = np.flatnonzero(load)
+        if (
+            sources.size <= _MAX_LOADED_NODES_FOR_SPARSE
+            and sources.size < _FRACTION_OF_NODES_LOADED_FOR_SPARSE * load.size
+        ):
+            dz.fill(0.0)
+            self._subside_loads_sparse(load, sources, dz)
+        else:
+            np.multiply(load, self._grid.dx * self._grid.dy, out=self._scaled_load)
+            if load.size >= _N_NODES_TO_USE_FFT:
+                self._subside_loads_fft(self._scaled_load, dz)
+            else:
+                if subside_grid_in_parallel is None:
+                    dz.fill(0.0)
+                    self._subside_loads_sparse(load, sources, dz)
+                else:
+                    if self._kernel_double is None:
+                        self._kernel_double = self._r.astype(np.float64, copy=False)
+                    dz.fill(0.0)
+                    subside_grid_in_parallel(
+                        dz,
+                        self._scaled_load,
+                        self._kernel_double,
+                        self.alpha,
+                        self.gamma_mantle,
+                        self._n_procs,
+                    )
+
+        return out
+
+    def _subside_loads_sparse(self, load, sources, dz):
+        """Subside surface due to loads at a sparse set of nodes.
+
+        Scatter a scaled copy of the stored kei quadrant into the
+        deflection grid for each loaded node, so the work scales with the
+        number of loaded nodes rather than with the square of the grid
+        size.
 
-        subside_grid_in_parallel(
-            dz,
-            load * self._grid.dx * self._grid.dy,
-            self._r,
-            self.alpha,
-            self.gamma_mantle,
-            self._n_procs,
+        Parameters
+        ----------
+        load : ndarray of float
+            Loads applied to each grid node.
+        sources : ndarray of int
+            Flat indices of the nodes that carry a load.
+        dz : ndarray of float
+            Buffer into which to accumulate deflections.
+        """
+        n_rows, n_cols = self._grid.shape
+        inv_c = (self._grid.dx * self._grid.dy) / (
+            2.0 * np.pi * self.gamma_mantle * self.alpha**2
         )
 
-        return out
+        for node in sources:
+            row, col = divmod(int(node), n_cols)
+            c = load[row, col] * inv_c
+
+            dz[: row + 1, : col + 1] -= c * self._r[row::-1, col::-1]
+            dz[: row + 1, col + 1 :] -= c * self._r[row::-1, 1 : n_cols - col]
+            dz[row + 1 :, : col + 1] -= c * self._r[1 : n_rows - row, col::-1]
+            dz[row + 1 :, col + 1 :] -= c * self._r[1 : n_rows - row, 1 : n_cols - col]
+
+    def _subside_loads_fft(self, load, dz):
+        """Subside surface due to multiple loads using an FFT-based convolution.
+
+        The deflection is the convolution of the scaled loads with the
+        kei-based Green's function and so can be calculated as a
+        multiplication in the frequency domain. The transformed kernel is
+        cached and reused until the kernel changes (e.g. *eet* is modified).
+
+        Parameters
+        ----------
+        load : ndarray of float
+            Loads, scaled by cell area, applied to each grid node.
+        dz : ndarray of float
+            Buffer into which to place deflections. Existing contents are
+            overwritten.
+        """
+        n_rows, n_cols = self._grid.shape
+        inv_c = 1.0 / (2.0 * np.pi * self.gamma_mantle * self.alpha**2)
+
+        if load.size >= _N_NODES_TO_USE_OVERLAP_ADD:
+            from scipy.signal import oaconvolve
+
+            if self._kernel_centered is None:
+                self._kernel_centered = self._mirror_kernel_quadrant(
+                    self._r, centered=True
+                )
+            load = load.astype(self._kernel_dtype, copy=False)
+            np.multiply(
+                oaconvolve(load, self._kernel_centered, mode="same"), -inv_c, out=dz
+            )
+            return
+
+        if self._kernel_fft is None:
+            self._kernel_fft = fft.rfft2(
+                self._mirror_kernel_quadrant(self._r), workers=self._n_procs
+            )
+
+        if self._padded_load is None:
+            self._padded_load = np.zeros(
+                (2 * n_rows, 2 * n_cols), dtype=self._kernel_dtype
+            )
+        self._padded_load[:n_rows, :n_cols] = load
+
+        load_fft = fft.rfft2(self._padded_load, workers=self._n_procs)
+        load_fft *= self._kernel_fft
+        np.multiply(
+            fft.irfft2(load_fft, workers=self._n_procs)[:n_rows, :n_cols],
+            -inv_c,
+            out=dz,
+        )
@@ -7,10 +7,37 @@ import pytest
 
 from landlab import RasterModelGrid
 from landlab.components import Flexure
+from landlab.components.flexure import flexure as flexure_module
 
 (_SHAPE, _SPACING, _ORIGIN) = ((20, 20), (10e3, 10e3), (0.0, 0.0))
 
 
+def _make_flexure(n, **kwds):
+    grid = RasterModelGrid((n, n), xy_spacing=10e3)
+    grid.add_zeros("lithosphere__overlying_pressure_increment", at="node")
+    return Flexure(grid, method="flexure", **kwds)
+
+
+def _reference_deflection(flex, load):
+    from scipy.special import kei
+
+    n_rows, n_cols = flex.grid.shape
+    x = np.arange(n_cols) * flex.grid.dx
+    y = np.arange(n_rows) * flex.grid.dy
+    c = (
+        flex.grid.dx
+        * flex.grid.dy
+        / (2.0 * np.pi * flex.gamma_mantle * flex.alpha**2)
+    )
+
+    dz = np.zeros((n_rows, n_cols))
+    for (i, j), w in np.ndenumerate(load):
+        r = np.hypot(x[np.newaxis, :] - x[j], y[:, np.newaxis] - y[i])
+        dz -= w * c * kei(r / flex.alpha)
+
+    return dz
+
+
 def test_method_names():
     grid = RasterModelGrid((20, 20), xy_spacing=10e3)
     grid.add_zeros("lithosphere__overlying_pressure_increment", at="node")
@@ -144,3 +171,100 @@ def test_subside_loads():
     out = np.zeros((n, n))
     dz = flex.subside_loads(load, out=out)
     assert dz is out
+
+
+def test_subside_loads_direct_dense():
+    flex = _make_flexure(16)
+    load = np.random.default_rng(1973).uniform(0.0, 1e9, size=flex.grid.shape)
+
+    dz = flex.subside_loads(load)
+
+    assert dz.flatten() == pytest.approx(_reference_deflection(flex, load).flatten())
+
+
+def test_subside_loads_fft_matches_direct(monkeypatch):
+    flex = _make_flexure(70)
+    load = np.random.default_rng(1973).uniform(0.0, 1e9, size=flex.grid.shape)
+
+    dz_fft = flex.subside_loads(load)
+    assert flex._kernel_fft is not None
+
+    monkeypatch.setattr(flexure_module, "_N_NODES_TO_USE_FFT", load.size + 1)
+    dz_direct = flex.subside_loads(load)
+
+    assert dz_fft.flatten() == pytest.approx(dz_direct.flatten())
+
+    flex.eet = flex.eet / 2.0
+    assert flex._kernel_fft is None
+
+
+def test_kernel_dtype_float32():
+    flex64 = _make_flexure(16)
+    flex32 = _make_flexure(16, kernel_dtype=np.float32)
+    assert flex32._r.dtype == np.float32
+
+    load = np.random.default_rng(1973).uniform(0.0, 1e9, size=flex64.grid.shape)
+
+    dz64 = flex64.subside_loads(load)
+    dz32 = flex32.subside_loads(load)
+
+    assert dz32.flatten() == pytest.approx(dz64.flatten(), rel=1e-5)
+
+
+def test_eet_setter_skips_rebuild_for_same_value():
+    flex = _make_flexure(70)
+    load = np.random.default_rng(1973).uniform(0.0, 1e9, size=flex.grid.shape)
+    flex.subside_loads(load)
+
+    kernel = flex._r
+    kernel_fft = flex._kernel_fft
+    assert kernel_fft is not None
+
+    flex.eet = flex.eet
+    assert flex._r is kernel
+    assert flex._kernel_fft is kernel_fft
+
+    flex.eet = flex.eet / 2.0
+    assert flex._r is not kernel
+    assert flex._kernel_fft is None
+
+
+def test_subside_loads_overwrites_out():
+    flex = _make_flexure(16)
+    load = np.zeros(flex.grid.shape)
+    load[8, 8] = 1e9
+
+    expected = flex.subside_loads(load)
+
+    out = np.full(flex.grid.shape, 1e6)
+    dz = flex.subside_loads(load, out=out)
+
+    assert dz is out
+    assert dz.flatten() == pytest.approx(expected.flatten())
+
+
+def test_subside_loads_sparse_matches_direct(monkeypatch):
+    flex = _make_flexure(16)
+    load = np.zeros(flex.grid.shape)
+    load[2, 3] = 1e9
+    load[11, 7] = 5e8
+
+    dz_sparse = flex.subside_loads(load)
+
+    monkeypatch.setattr(flexure_module, "_MAX_LOADED_NODES_FOR_SPARSE", -1)
+    dz_direct = flex.subside_loads(load)
+
+    assert dz_sparse.flatten() == pytest.approx(dz_direct.flatten())
+
+
+def test_subside_loads_overlap_add_matches_fft(monkeypatch):
+    flex = _make_flexure(32)
+    load = np.random.default_rng(1973).uniform(0.0, 1e9, size=flex.grid.shape)
+
+    monkeypatch.setattr(flexure_module, "_N_NODES_TO_USE_FFT", 0)
+    dz_fft = flex.subside_loads(load)
+
+    monkeypatch.setattr(flexure_module, "_N_NODES_TO_USE_OVERLAP_ADD", 0)
+    dz_overlap_add = flex.subside_loads(load)
+
+    assert dz_overlap_add.flatten() == pytest.approx(dz_fft.flatten())